@@ -7,22 +7,46 @@ inspired by Cursor's Memory Bank concept but implemented through a structured st
 management system.
 """
 
-from memory_bank.core import MemoryBankManager
-from memory_bank.sections import (
-    get_section, 
-    update_section, 
-    check_dependencies_complete, 
-    get_ready_sections,
-    log_change
-)
-from memory_bank.workflows import (
-    enter_plan_mode,
-    enter_act_mode,
-    update_all_memory_bank
-)
-from memory_bank.exporters import (
-    export_markdown,
-    import_markdown
-)
+import importlib
+
+# Public names and the submodules they live in. They're imported on first
+# access, so importing one submodule (say memory_bank.core) doesn't pull in
+# the exporters and workflows as well.
+_EXPORTS = {
+    "MemoryBankManager": "memory_bank.core",
+    "get_section": "memory_bank.sections",
+    "update_section": "memory_bank.sections",
+    "update_sections": "memory_bank.sections",
+    "mark_complete": "memory_bank.sections",
+    "check_dependencies_complete": "memory_bank.sections",
+    "get_ready_sections": "memory_bank.sections",
+    "log_change": "memory_bank.sections",
+    "update_active_context": "memory_bank.sections",
+    "enter_plan_mode": "memory_bank.workflows",
+    "enter_act_mode": "memory_bank.workflows",
+    "update_all_memory_bank": "memory_bank.workflows",
+    "export_markdown": "memory_bank.exporters",
+    "import_markdown": "memory_bank.exporters"
+}
+
+# Submodules, also loaded on first access as memory_bank.<name>
+_SUBMODULES = ("core", "sections", "workflows", "exporters", "schemas")
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        if name in _SUBMODULES:
+            # Importing a submodule binds it on the package as well
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache it, so later lookups don't come through here again
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
 
 __version__ = '0.1.0'
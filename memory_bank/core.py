@@ -1,105 +1,623 @@
 # memory_bank/core.py
+import io
 import os
+import sys
+import copy
 import json
+import mmap
+import time
+import hashlib
 import datetime
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
+
+from .schemas import MEMORY_BANK_SCHEMA, ValidationError, get_validator
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib json
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, fall back to hashlib's blake2b
+    xxhash = None
+
+def _dumps(state):
+    """Serialize state to indented JSON bytes"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS turns int/float/bool/None keys into strings the
+        # way json.dumps does, instead of raising
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, indent=2).encode("utf-8")
+
+def _loads(data):
+    """Parse JSON bytes (or a memoryview over them) into a state dict"""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # only need to catch the stdlib exception
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+def _dumps_line(entry):
+    """Serialize one entry as a compact, newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(entry).encode("utf-8") + b"\n"
+
+def _digest(data):
+    """Fingerprint serialized state so unchanged saves can be skipped"""
+    # Digests are only ever compared within one process, so either hash will do
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _now_iso(stamp=None):
+    """Format a time.time() stamp (default: now) as a local ISO-8601 timestamp"""
+    return datetime.datetime.fromtimestamp(time.time() if stamp is None else stamp).isoformat()
+
+def _restamp(payload, old, new):
+    """Swap metadata.lastUpdated in a serialized state from old to new, or None if it can't be found"""
+    # Both serializers indent by two spaces and escape newlines inside
+    # strings, so a raw newline plus indent only ever starts a key: these
+    # patterns can't match inside section content
+    start = payload.find(b'\n  "metadata": {')
+    if start < 0 or not isinstance(old, str):
+        return None
+    end = payload.find(b"\n  }", start)
+    key = b'\n    "lastUpdated": '
+    at = payload.find(key + json.dumps(old).encode("utf-8"), start, end)
+    if at < 0:
+        return None
+    at += len(key)
+    return payload[:at] + json.dumps(new).encode("utf-8") + payload[at + len(json.dumps(old)):]
+
+def _intern_keys(state):
+    """Intern the section names and the keys of each section in a parsed state
+
+    Parsed keys are fresh string objects, so lookups with the literal names
+    used across the package have to compare them char by char. Interned,
+    they're the same object as those literals and a lookup is a pointer
+    compare. Only the top two levels are walked; that's where the names are.
+    """
+    if not isinstance(state, dict):
+        return state
+    return {
+        sys.intern(name): {sys.intern(k): v for k, v in section.items()} if isinstance(section, dict) else section
+        for name, section in state.items()
+    }
+
+# Files at least this big are read through mmap instead of read()
+_MMAP_THRESHOLD = 16 * 1024
+
+@contextmanager
+def _read_buffer(path):
+    """Yield a file's bytes, mapping the file into memory when it's large
+
+    The buffer is only valid inside the with block.
+    """
+    with open(path, 'rb') as f:
+        # For small files a plain read() beats setting up a mapping
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            yield view
+
+def _write_raw(path, data, flags, sync=False):
+    """Write data straight to a file descriptor, bypassing Python's buffered I/O"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than asked for
+            view = view[os.write(fd, view):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _fsync_dir(path):
+    """Make the renames and unlinks made in a directory durable"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # Directories can't be opened on every platform (e.g. Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# Static skeleton of a new project's state; created, lastUpdated and the
+# project name are filled in per project
+_INITIAL_STATE = {
+    "metadata": {
+        "created": None,
+        "lastUpdated": None,
+        "version": "1.0.0"
+    },
+    "projectInfo": {
+        "name": None,
+        "description": "",
+        "content": "",
+        "status": "Not Started"
+    },
+    "productContext": {
+        "content": "",
+        "status": "Pending"
+    },
+    "systemPatterns": {
+        "content": "",
+        "status": "Pending"
+    },
+    "technologies": {
+        "content": "",
+        "items": [],
+        "status": "Pending"
+    },
+    "tasks": {
+        "current": {
+            "description": "",
+            "status": "Pending",
+            "steps": [],
+            "activeContext": ""
+        },
+        "history": []
+    },
+    "standards": {
+        "content": "",
+        "items": [],
+        "status": "Pending"
+    },
+    "changeHistory": []
+}
+
+def _default_state(project_name):
+    """Build the initial memory state for a new project"""
+    state = copy.deepcopy(_INITIAL_STATE)
+    now = _now_iso()
+    state["metadata"]["created"] = state["metadata"]["lastUpdated"] = now
+    state["projectInfo"]["name"] = project_name
+    return state
+
+# Number of section deltas after which the next one writes a full snapshot
+# and starts the delta journal over
+SNAPSHOT_INTERVAL = 100
+
+# The full change history lives in an append-only archive next to the state
+# file; memory_state only keeps this many of the most recent entries
+CHANGE_HISTORY_TAIL = 100
+
+# Section dependencies (which sections depend on which). Read-only, so every
+# manager can share the same mapping; the dependency sets are only ever
+# tested for membership or checked as a whole, so order doesn't matter.
+SECTION_DEPENDENCIES = MappingProxyType({
+    "projectInfo": frozenset(),
+    "productContext": frozenset({"projectInfo"}),
+    "systemPatterns": frozenset({"projectInfo"}),
+    "standards": frozenset({"systemPatterns"}),
+    "technologies": frozenset({"projectInfo"}),
+    "tasks": frozenset({"productContext", "systemPatterns", "technologies"}),
+    "changeHistory": frozenset()
+})
 
 class MemoryBankManager:
     """Core Memory Bank State Manager"""
     
-    def __init__(self, project_root="."):
+    def __init__(self, project_root=".", initial_state=None, read_only=False):
         self.project_root = Path(project_root)
         self.memory_path = self.project_root / "memory-bank"
+        # JSON-lines journals, one object per line: section replacements since
+        # the last full save, and the complete change history
+        self.delta_log_file = self.memory_path / "memory_state.log"
+        self.change_log_file = self.memory_path / "change_history.jsonl"
+        # Journals whose last line was cut short by an interrupted append
+        self._torn_logs = set()
+        self._delta_count = 0
         self.memory_state = {}
+        # memory_state["changeHistory"], once checked to be a list
+        self._change_history = None
+        # Newest change entry known to be in the archive
+        self._last_archived = None
+        # Digest of the state as last read from or written to disk
+        self._last_hash = None
+        # Saves requested inside batch() are deferred to the end of the block
+        self._in_batch = False
+        self._dirty = False
+        # Sections replaced inside the batch, saved with it on exit
+        self._dirty_sections = {}
+        # Change entries logged inside the batch, archived in one append on exit
+        self._pending_changes = []
+        # time.time() of the last deferred mutation, stamped as lastUpdated on flush
+        self._pending_timestamp = None
+        self._batches = []
+        # Load without touching disk (no mkdir, migration or corrupt-file
+        # rename) and refuse to write, e.g. for a dry run
+        self.read_only = read_only
         
-        # Define section dependencies (which sections depend on which)
-        self.section_dependencies = {
-            "projectInfo": [],
-            "productContext": ["projectInfo"],
-            "systemPatterns": ["projectInfo"],
-            "standards": ["systemPatterns"],
-            "technologies": ["projectInfo"],
-            "tasks": ["productContext", "systemPatterns", "technologies"],
-            "changeHistory": []
-        }
+        self.section_dependencies = SECTION_DEPENDENCIES
+        # Shared, already-compiled validator for the state schema
+        self._validate = get_validator(MEMORY_BANK_SCHEMA)
         
-        self.init_memory_bank()
+        if initial_state is not None:
+            # The caller already holds the state (e.g. bootstrap just wrote
+            # it), so skip reading it back from disk
+            self.memory_path.mkdir(exist_ok=True)
+            self.memory_state = initial_state
+        else:
+            self.init_memory_bank()
     
     def init_memory_bank(self):
         """Initialize memory bank structure if it doesn't exist"""
-        self.memory_path.mkdir(exist_ok=True)
+        if not self.read_only:
+            self.memory_path.mkdir(exist_ok=True)
         
-        # Initialize the state file
         state_file = self.memory_path / "memory_state.json"
-        if not state_file.exists():
-            initial_state = {
-                "metadata": {
-                    "created": datetime.datetime.now().isoformat(),
-                    "lastUpdated": datetime.datetime.now().isoformat(),
-                    "version": "1.0.0"
-                },
-                "projectInfo": {
-                    "name": os.path.basename(self.project_root),
-                    "description": "",
-                    "content": "",
-                    "status": "Not Started"
-                },
-                "productContext": {
-                    "content": "",
-                    "status": "Pending"
-                },
-                "systemPatterns": {
-                    "content": "",
-                    "status": "Pending"
-                },
-                "technologies": {
-                    "content": "",
-                    "items": [],
-                    "status": "Pending"
-                },
-                "tasks": {
-                    "current": {
-                        "description": "",
-                        "status": "Pending",
-                        "steps": [],
-                        "activeContext": ""
-                    },
-                    "history": []
-                },
-                "standards": {
-                    "content": "",
-                    "items": [],
-                    "status": "Pending"
-                },
-                "changeHistory": []
-            }
-            
-            with open(state_file, 'w') as f:
-                json.dump(initial_state, f, indent=2)
-                
-        self.load_memory_state()
+        if state_file.exists():
+            self.load_memory_state()
+        else:
+            self._start_fresh()
+    
+    def _start_fresh(self):
+        """Start from the default state, plus anything journaled since"""
+        # The state file is written by the first save instead of being written
+        # here and immediately read back.
+        # Path(".").name is empty, so fall back to the resolved directory
+        project_name = self.project_root.name or self.project_root.resolve().name
+        self.memory_state = _default_state(project_name)
+        self._last_hash = None
+        self._replay_logs()
     
     def load_memory_state(self):
         """Load memory state from JSON file"""
         state_file = self.memory_path / "memory_state.json"
         try:
-            with open(state_file, 'r') as f:
-                self.memory_state = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Handle corrupted or missing file
-            self.init_memory_bank()
+            with _read_buffer(state_file) as data:
+                if not data:
+                    # An interrupted first write; treat it like any other corruption
+                    raise json.JSONDecodeError("Empty state file", "", 0)
+                state = _loads(data)
+                if not isinstance(state, dict):
+                    # Parses, but there's no memory bank in it to keep
+                    raise json.JSONDecodeError(f"Expected an object, got {type(state).__name__}", "", 0)
+                self.memory_state = _intern_keys(state)
+                self._last_hash = _digest(data)
+            # Reject a structurally broken state here, not deep inside an exporter
+            self._validate(self.memory_state)
+        except FileNotFoundError:
+            self._start_fresh()
+            return
+        except json.JSONDecodeError as e:
+            if self.read_only:
+                print(f"Warning: {state_file} is not a valid memory state ({e}); using the default state",
+                      file=sys.stderr)
+                self._start_fresh()
+                return
+            # Corrupted file - set it aside under a name of its own, so the
+            # next save doesn't rotate it out of the backup slot and a later
+            # corruption doesn't overwrite it, and start over
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            corrupt_file = state_file.with_name(f"memory_state.corrupt-{stamp}.json")
+            n = 1
+            while corrupt_file.exists():
+                n += 1
+                corrupt_file = state_file.with_name(f"memory_state.corrupt-{stamp}-{n}.json")
+            state_file.replace(corrupt_file)
+            print(f"Warning: {state_file} is not a valid memory state ({e}); moved it to {corrupt_file.name} "
+                  f"and started from the default state", file=sys.stderr)
+            self._start_fresh()
+            return
+        except ValidationError as e:
+            # The file parses, so it still holds the user's data - refuse to
+            # load it rather than replace it with defaults. (Caught after
+            # JSONDecodeError: without fastjsonschema this is plain ValueError.)
+            raise ValueError(f"Invalid memory state in {state_file}, fix or remove it: {e}") from e
+        self._replay_logs()
+    
+    def _read_log(self, log_file, last=None):
+        """Read the entries of a JSON-lines journal, or only its last few"""
+        try:
+            data = log_file.read_bytes()
+        except FileNotFoundError:
+            return []
+        if data and not data.endswith(b"\n"):
+            # The next append has to start a fresh line, or it would be glued
+            # onto the torn one and be dropped along with it
+            self._torn_logs.add(log_file)
+        
+        if last is not None:
+            # Scan back from the end for the start of the last few lines
+            # (one extra, in case the final line is torn)
+            start = len(data.rstrip(b"\n"))
+            for _ in range(last + 1):
+                start = data.rfind(b"\n", 0, start)
+                if start < 0:
+                    break
+            data = data[start + 1:]
+        
+        entries = []
+        for line in data.splitlines():
+            try:
+                entries.append(_loads(line))
+            except json.JSONDecodeError:
+                # Torn final line from an interrupted append
+                continue
+        return entries
+    
+    def iter_change_history(self):
+        """Yield the complete change history, oldest first"""
+        # memory_state["changeHistory"] only holds the most recent entries
+        yield from self._read_log(self.change_log_file)
+    
+    def _replay_logs(self):
+        """Fold the journals written since the last full save into the state"""
+        deltas = self._read_log(self.delta_log_file)
+        for patch in deltas:
+            self.memory_state.update(patch)
+        self._delta_count = len(deltas)
+        
+        history = self.memory_state.get("changeHistory")
+        if isinstance(history, list) and history:
+            # A snapshot from before the history moved out of the state file.
+            # Fold it into the archive, which then holds only entries logged
+            # since that snapshot - unless it was folded in already, or an
+            # older save was interrupted after folding the archive into it.
+            entries = self._read_log(self.change_log_file)
+            if entries[:len(history)] != history:
+                if entries and history[-len(entries):] != entries:
+                    history = history + entries
+                if not self.read_only:
+                    _write_raw(self.change_log_file, b"".join(map(_dumps_line, history)), os.O_TRUNC, sync=True)
+                    self._torn_logs.discard(self.change_log_file)
+                entries = history
+        else:
+            entries = self._read_log(self.change_log_file, last=CHANGE_HISTORY_TAIL)
+        self.memory_state["changeHistory"] = entries[-CHANGE_HISTORY_TAIL:]
+        self._last_archived = entries[-1] if entries else None
+    
+    def _check_valid(self, target_file):
+        """Raise ValueError if the state doesn't match the schema"""
+        try:
+            self._validate(self.memory_state)
+        except ValidationError as e:
+            raise ValueError(f"Invalid memory state, not saving {target_file}: {e}") from e
+    
+    def _check_writable(self):
+        """Raise io.UnsupportedOperation if the manager was opened read-only"""
+        if self.read_only:
+            raise io.UnsupportedOperation(f"Memory bank at {self.memory_path} was opened read-only")
+    
+    def _append_log(self, log_file, *entries, sync=False):
+        """Append entries to a journal, one line each"""
+        self._append_bytes(log_file, b"".join(map(_dumps_line, entries)), sync)
+    
+    def _append_bytes(self, log_file, data, sync=False):
+        """Append already serialized lines to a journal"""
+        self._check_writable()
+        if log_file in self._torn_logs:
+            # Terminate the torn line first, so it's the only one skipped
+            data = b"\n" + data
+        # O_APPEND makes the whole append a single write at the end of the file
+        _write_raw(log_file, data, os.O_APPEND, sync=sync)
+        self._torn_logs.discard(log_file)
+    
+    def append_delta(self, patch):
+        """Persist replaced top-level sections without rewriting the whole state file
+        
+        patch maps section names to their new values, which must already be
+        in memory_state. The delta is replayed over the snapshot on load.
+        """
+        if self._in_batch:
+            self._mark_dirty(patch)
+            return
+        if self._last_hash is None:
+            # No snapshot of this state on disk yet - write one, so the
+            # journal is never all there is
+            self.save_memory_state()
+            return
+        
+        self.memory_state["metadata"]["lastUpdated"] = _now_iso()
+        self._check_valid(self.delta_log_file)
+        self._append_log(self.delta_log_file, dict(patch, metadata=self.memory_state["metadata"]))
+        
+        self._delta_count += 1
+        if self._delta_count >= SNAPSHOT_INTERVAL:
+            self.save_memory_state()
+    
+    def append_change_log(self, change):
+        """Add one change entry to the history and archive it"""
+        # Serialize (and, outside a batch, archive) before touching the state:
+        # an entry that can't be written mustn't end up in the history, where
+        # every later save would try to archive it again
+        line = _dumps_line(change)
+        if not self._in_batch:
+            self._append_bytes(self.change_log_file, line)
+        
+        # Reuse the list checked on the previous call, as long as the state
+        # (or its changeHistory) hasn't been replaced since
+        history = self._change_history
+        if history is None or self.memory_state.get("changeHistory") is not history:
+            history = self.memory_state.get("changeHistory")
+            if not isinstance(history, list):
+                history = self.memory_state["changeHistory"] = []
+            self._change_history = history
+        
+        history.append(change)
+        # Keep just the tail in memory
+        del history[:-CHANGE_HISTORY_TAIL]
+        
+        # Inside a batch the entry is archived along with the rest of the
+        # block's changes when it flushes
+        if self._in_batch:
+            self._pending_changes.append(change)
+        else:
+            self._last_archived = change
             
-    def save_memory_state(self):
-        """Save memory state to JSON file"""
-        self.memory_state["metadata"]["lastUpdated"] = datetime.datetime.now().isoformat()
+    @contextmanager
+    def batch(self):
+        """Defer saves until the end of the block and write the state once
+        
+        If the block raises, nothing it deferred is written and memory_state
+        is reloaded from disk, so a half-applied block is never committed.
+        """
+        if self._in_batch:
+            # Nested batch - the outermost one saves
+            yield self
+            return
+        
+        self._in_batch = True
+        try:
+            yield self
+        except BaseException:
+            self._in_batch = False
+            self.discard()
+            self.init_memory_bank()
+            raise
+        self._in_batch = False
+        if self._dirty or self._dirty_sections or self._pending_changes:
+            self.flush()
+    
+    def __enter__(self):
+        """Use the manager itself as a batch: one save when the block exits"""
+        self._batches.append(self.batch())
+        return self._batches[-1].__enter__()
+    
+    def __exit__(self, *exc_info):
+        return self._batches.pop().__exit__(*exc_info)
+    
+    def _mark_dirty(self, patch=None):
+        """Record a mutation whose save was deferred
+        
+        patch holds the sections a deferred delta replaced, so discard() can
+        report them; either way the batch saves a snapshot on exit.
+        """
+        if patch is None:
+            self._dirty = True
+        else:
+            self._dirty_sections.update(patch)
+        self._pending_timestamp = time.time()
+    
+    def flush(self):
+        """Write deferred changes now, even inside a batch, and sync them to disk"""
+        dirty, self._dirty = self._dirty, False
+        sections, self._dirty_sections = self._dirty_sections, {}
+        changes, self._pending_changes = self._pending_changes, []
+        in_batch, self._in_batch = self._in_batch, False
+        try:
+            if changes:
+                # The archive is the only durable copy of the history, so it
+                # goes first, as a single write of all the buffered lines
+                self._append_log(self.change_log_file, *changes, sync=True)
+                self._last_archived = changes[-1]
+            if dirty or sections:
+                # A batch ends in a full snapshot, so memory_state.json is
+                # current after every block rather than trailing the journal.
+                # For a block's worth of sections that's about the same bytes
+                # as a delta would be.
+                self.save_memory_state(sync=True)
+        finally:
+            self._in_batch = in_batch
+    
+    def discard(self):
+        """Drop the writes deferred so far, leaving memory_state as it is
+        
+        Returns the names of the sections whose changes won't be written.
+        """
+        sections = list(self._dirty_sections)
+        self._dirty = False
+        self._dirty_sections = {}
+        self._pending_changes = []
+        self._pending_timestamp = None
+        return sections
+    
+    def save_memory_state(self, sync=False):
+        """Save memory state to JSON file, fsyncing it first if sync is set"""
+        if self._in_batch:
+            self._mark_dirty()
+            return
+        
+        # The snapshot leaves the history out, so entries appended to it
+        # directly have to reach the archive here or they'd be lost
+        self._archive_history(sync)
+        
+        # Nothing changed since the last load/save - skip the rewrite
+        payload = self._snapshot_bytes()
+        if _digest(payload) == self._last_hash:
+            return
+        self._check_writable()
+        
+        # Deferred saves carry the time of the last mutation, not of the flush
+        stamp, self._pending_timestamp = self._pending_timestamp, None
+        metadata = self.memory_state["metadata"]
+        old_stamp = metadata.get("lastUpdated")
+        metadata["lastUpdated"] = _now_iso(stamp)
         state_file = self.memory_path / "memory_state.json"
         
-        # Save with backup
-        if state_file.exists():
-            backup_file = self.memory_path / "memory_state.backup.json"
-            with open(state_file, 'r') as src:
-                with open(backup_file, 'w') as dst:
-                    dst.write(src.read())
+        # Refuse to persist a state that doesn't match the schema
+        self._check_valid(state_file)
+        # Only the timestamp changed since the snapshot above - patch it in
+        # rather than serializing the whole state a second time
+        payload = _restamp(payload, old_stamp, metadata["lastUpdated"]) or self._snapshot_bytes()
+        
+        # Write the new state next to the old one, swap a hardlink of the old
+        # file into the backup slot and atomically move the new one into place.
+        # Every step is a rename or link, so no state bytes are copied and
+        # neither slot is ever missing.
+        tmp_file = state_file.with_suffix(".json.tmp")
+        # With sync the data is on disk before the rename, so even a power
+        # loss can't install a truncated file. Batches and flush() ask for it,
+        # and so does any save that's about to drop a delta journal: once the
+        # journal is gone the snapshot is the only copy of those deltas.
+        # Other individual saves skip the fsync and rely on the rename alone.
+        sync = sync or self.delta_log_file.exists()
+        _write_raw(tmp_file, payload, os.O_TRUNC, sync=sync)
+        
+        backup_file = self.memory_path / "memory_state.backup.json"
+        backup_tmp = backup_file.with_suffix(".json.tmp")
+        try:
+            backup_tmp.unlink(missing_ok=True)
+            os.link(state_file, backup_tmp)
+            os.replace(backup_tmp, backup_file)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Filesystem without hardlinks - rename the old file instead
+            os.replace(state_file, backup_file)
+        os.replace(tmp_file, state_file)
+        if sync:
+            # The rename has to be durable before the journal is unlinked
+            _fsync_dir(self.memory_path)
+        self._last_hash = _digest(payload)
+        
+        # Every delta journaled so far is part of the snapshot now, torn
+        # last line included
+        self.delta_log_file.unlink(missing_ok=True)
+        self._torn_logs.discard(self.delta_log_file)
+        self._delta_count = 0
+    
+    def _archive_history(self, sync=False):
+        """Append changeHistory entries added without append_change_log() to the archive"""
+        history = self.memory_state.get("changeHistory")
+        if not isinstance(history, list) or not history:
+            return
         
-        with open(state_file, 'w') as f:
-            json.dump(self.memory_state, f, indent=2)
+        # Everything after the newest archived entry is new; usually that's
+        # the last entry and this is a single identity check
+        last = self._last_archived
+        start = 0
+        if last is not None:
+            for i in range(len(history) - 1, -1, -1):
+                if history[i] is last or history[i] == last:
+                    start = i + 1
+                    break
+        if start < len(history):
+            self._append_log(self.change_log_file, *history[start:], sync=sync)
+            self._last_archived = history[-1]
+    
+    def _snapshot_bytes(self):
+        """Serialize the state for memory_state.json, minus the archived history"""
+        return _dumps({**self.memory_state, "changeHistory": []})
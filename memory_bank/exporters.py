@@ -1,134 +1,171 @@
 # memory_bank/exporters.py
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+from .core import _read_buffer, _write_raw
+
+# Write exports to a temporary file and rename it over the old one, so an
+# interrupted export never leaves a half-written file behind
+ATOMIC_WRITE = True
+
+def _read_text(file_path):
+    """Read a UTF-8 file, mapping it into memory when it's large"""
+    # Decoded straight from the buffer, so a mapped file needs no bytes copy
+    with _read_buffer(file_path) as data:
+        return str(data, "utf-8")
+
+def _safe_get(d, *keys, default=None):
+    """Walk nested dicts along keys, returning default if any hop is missing or not a dict"""
+    for key in keys:
+        if not isinstance(d, dict) or key not in d:
+            return default
+        d = d[key]
+    return d
+
+def _write_bytes_if_changed(md_file, data):
+    """Write data to md_file unless the file already holds exactly those bytes"""
+    try:
+        # A size mismatch settles it without reading the old file back
+        if md_file.stat().st_size == len(data) and md_file.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    if not ATOMIC_WRITE:
+        md_file.write_bytes(data)
+        return
+    
+    tmp_file = md_file.with_name(md_file.name + ".tmp")
+    _write_raw(tmp_file, data, os.O_TRUNC)
+    os.replace(tmp_file, md_file)
+
+def _write_all(files):
+    """Write (path, bytes) pairs, skipping files that are already up to date"""
+    # Serially: for a handful of small files a thread pool costs more in
+    # start-up than it could ever overlap
+    for md_file, data in files:
+        _write_bytes_if_changed(md_file, data)
+
+def _tasks_md(tasks, md_file):
+    """Render the tasks section as activeContext.md and progress.md (path, bytes) pairs"""
+    # Export activeContext
+    active_context = _safe_get(tasks, "current", "activeContext", default="")
+    
+    # Export progress
+    # Encode entries as they're formatted so the file body only ever
+    # exists once, as bytes, rather than as a str plus its encoded copy
+    parts = [b"# Project Progress\n\n"]
+    history = tasks.get("history")
+    if isinstance(history, list):
+        parts.extend(f"## {task.get('description', 'Task')}\n{task['progress']}\n\n".encode("utf-8")
+                     for task in history
+                     if isinstance(task, dict) and "progress" in task)
+    
+    return [(md_file, active_context.encode("utf-8")),
+            (md_file.with_name("progress.md"), b"".join(parts))]
+
+def _section_md(section, name, md_file):
+    """Render a regular section as a (path, bytes) pair for its markdown file"""
+    if "content" in section:
+        text = section["content"]
+    else:
+        text = f"# {name}\n\n*No content yet*"
+    return md_file, text.encode("utf-8")
+
+# Section name -> the markdown file it's exported to
+_EXPORT_FILES = {
+    "projectInfo": "projectbrief.md",
+    "productContext": "productContext.md",
+    "systemPatterns": "systemPatterns.md",
+    "technologies": "techContext.md",
+    "tasks": "activeContext.md"  # We'll handle progress.md separately
+}
+
+# A process rarely works on more than a couple of memory banks; the bound
+# keeps one that opens many from growing the cache forever
+@lru_cache(maxsize=8)
+def _export_paths(mpath):
+    """Map each exported section to its markdown file under mpath, built once per memory bank"""
+    return MappingProxyType({name: mpath / file_name for name, file_name in _EXPORT_FILES.items()})
 
 def export_markdown(memory_manager, section_name=None):
     """Export memory section(s) to markdown files"""
-    mapping = {
-        "projectInfo": "projectbrief.md",
-        "productContext": "productContext.md",
-        "systemPatterns": "systemPatterns.md",
-        "technologies": "techContext.md",
-        "tasks": "activeContext.md"  # We'll handle progress.md separately
-    }
+    state = memory_manager.memory_state
+    mpath = memory_manager.memory_path
+    paths = _export_paths(mpath)
     
-    if section_name:
-        # Export a single section
-        if section_name in memory_manager.memory_state:
-            if section_name == "tasks" and isinstance(memory_manager.memory_state[section_name], dict):
-                # Export activeContext
-                md_file = memory_manager.memory_path / "activeContext.md"
-                with open(md_file, 'w') as f:
-                    if "current" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["current"], dict):
-                        active_context = memory_manager.memory_state["tasks"]["current"].get("activeContext", "")
-                        f.write(active_context)
-                
-                # Export progress
-                md_file = memory_manager.memory_path / "progress.md"
-                with open(md_file, 'w') as f:
-                    progress_content = "# Project Progress\n\n"
-                    if "history" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["history"], list):
-                        for task in memory_manager.memory_state["tasks"]["history"]:
-                            if isinstance(task, dict) and "progress" in task:
-                                task_desc = task.get("description", "Task")
-                                progress_content += f"## {task_desc}\n{task['progress']}\n\n"
-                    f.write(progress_content)
-            else:
-                # Export regular section - only if it's a dictionary with content
-                if section_name in mapping and isinstance(memory_manager.memory_state[section_name], dict):
-                    md_file = memory_manager.memory_path / mapping[section_name]
-                    with open(md_file, 'w') as f:
-                        section = memory_manager.memory_state[section_name]
-                        if "content" in section:
-                            f.write(section["content"])
-                        else:
-                            f.write(f"# {section_name}\n\n*No content yet*")
-                return md_file
-    else:
-        # Export all sections
-        for name, filename in mapping.items():
-            if name in memory_manager.memory_state:
-                if name == "tasks" and isinstance(memory_manager.memory_state[name], dict):
-                    # Export activeContext
-                    md_file = memory_manager.memory_path / "activeContext.md"
-                    with open(md_file, 'w') as f:
-                        if "current" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["current"], dict):
-                            active_context = memory_manager.memory_state["tasks"]["current"].get("activeContext", "")
-                            f.write(active_context)
-                    
-                    # Export progress
-                    md_file = memory_manager.memory_path / "progress.md"
-                    with open(md_file, 'w') as f:
-                        progress_content = "# Project Progress\n\n"
-                        if "history" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["history"], list):
-                            for task in memory_manager.memory_state["tasks"]["history"]:
-                                if isinstance(task, dict) and "progress" in task:
-                                    task_desc = task.get("description", "Task")
-                                    progress_content += f"## {task_desc}\n{task['progress']}\n\n"
-                        f.write(progress_content)
-                else:
-                    # Export regular section - only if it's a dictionary with content
-                    if isinstance(memory_manager.memory_state[name], dict):
-                        md_file = memory_manager.memory_path / filename
-                        with open(md_file, 'w') as f:
-                            if "content" in memory_manager.memory_state[name]:
-                                f.write(memory_manager.memory_state[name]["content"])
-                            else:
-                                f.write(f"# {name}\n\n*No content yet*")
-        return memory_manager.memory_path
+    # Export a single section, or all of them. Everything is rendered in
+    # memory first so the writes can then go out together.
+    names = [section_name] if section_name else list(_EXPORT_FILES)
+    files = []
+    md_file = None
+    for name in names:
+        section = state.get(name)
+        # Only sections that exist and are dictionaries get exported
+        if name not in paths or not isinstance(section, dict):
+            continue
+        if name == "tasks":
+            files.extend(_tasks_md(section, paths[name]))
+        else:
+            md_file = paths[name]
+            files.append(_section_md(section, name, md_file))
+    _write_all(files)
+    
+    return md_file if section_name else mpath
+
+def _import_task_field(key):
+    """Build an importer that stores the file content under tasks.current[key]"""
+    def handler(memory_manager, content):
+        current = _safe_get(memory_manager.memory_state, "tasks", "current")
+        if not isinstance(current, dict):
+            return False
+        current[key] = content
+        memory_manager.save_memory_state()
+        return True
+    return handler
+
+def _import_section(name):
+    """Build an importer that replaces the content of a regular section"""
+    def handler(memory_manager, content):
+        section = memory_manager.memory_state.get(name)
+        if not isinstance(section, dict):
+            return False
+        section["content"] = content
+        section["status"] = "Complete"
+        memory_manager.save_memory_state()
+        return True
+    return handler
+
+# Markdown file name -> importer, built once at import time
+_IMPORT_HANDLERS = {
+    "projectbrief.md": _import_section("projectInfo"),
+    "productContext.md": _import_section("productContext"),
+    "systemPatterns.md": _import_section("systemPatterns"),
+    "techContext.md": _import_section("technologies"),
+    "activeContext.md": _import_task_field("activeContext"),
+    # This is simplified - in real life you'd want more robust parsing
+    "progress.md": _import_task_field("progress")
+}
 
 def import_markdown(memory_manager, section_name, file_path=None):
     """Import markdown content into a memory section"""
-    mapping = {
-        "projectbrief.md": "projectInfo",
-        "productContext.md": "productContext",
-        "systemPatterns.md": "systemPatterns",
-        "techContext.md": "technologies",
-        "activeContext.md": "tasks",
-        "progress.md": "tasks"
-    }
-    
-    if not file_path:
-        # Try to derive file path from section name
-        for md_file, section in mapping.items():
-            if section == section_name:
-                file_path = memory_manager.memory_path / md_file
-                break
+    if not file_path and section_name in _EXPORT_FILES:
+        # Derive file path from section name - sections import from the file they export to
+        file_path = _export_paths(memory_manager.memory_path)[section_name]
     
+    # Checking first keeps the common "no such file" case exception-free
     if not file_path or not os.path.exists(file_path):
         return False
-        
-    try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-    except:
-        return False
     
-    # Handle special case for activeContext.md and progress.md
-    file_name = Path(file_path).name
-    if file_name == "activeContext.md":
-        if "tasks" in memory_manager.memory_state and isinstance(memory_manager.memory_state["tasks"], dict):
-            if "current" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["current"], dict):
-                memory_manager.memory_state["tasks"]["current"]["activeContext"] = content
-                memory_manager.save_memory_state()
-                return True
+    handler = _IMPORT_HANDLERS.get(Path(file_path).name)
+    if handler is None:
         return False
-    elif file_name == "progress.md":
-        # This is simplified - in real life you'd want more robust parsing
-        if "tasks" in memory_manager.memory_state and isinstance(memory_manager.memory_state["tasks"], dict):
-            if "current" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["current"], dict):
-                memory_manager.memory_state["tasks"]["current"]["progress"] = content
-                memory_manager.save_memory_state()
-                return True
+        
+    try:
+        content = _read_text(file_path)
+    except (OSError, UnicodeDecodeError):
+        # Unreadable file (vanished, permissions, directory) or not UTF-8
         return False
     
-    # Handle regular sections
-    if file_name in mapping:
-        section_name = mapping[file_name]
-        if section_name in memory_manager.memory_state and isinstance(memory_manager.memory_state[section_name], dict):
-            memory_manager.memory_state[section_name]["content"] = content
-            memory_manager.memory_state[section_name]["status"] = "Complete"
-            memory_manager.save_memory_state()
-            return True
-    
-    return False
+    return handler(memory_manager, content)
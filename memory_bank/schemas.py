@@ -2,6 +2,19 @@
 """
 JSON schema definitions for the Memory Bank State Management System.
 """
+import json
+import datetime
+import threading
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional, validation is skipped without it
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib json
+    orjson = None
 
 # Base schema for the memory bank state
 MEMORY_BANK_SCHEMA = {
@@ -130,3 +143,47 @@ MEMORY_BANK_SCHEMA = {
         }
     }
 }
+
+def _is_iso_datetime(value):
+    """Accept the naive ISO timestamps written by datetime.isoformat()"""
+    # fastjsonschema's built-in date-time format insists on a UTC offset
+    try:
+        datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+def _accept(state):
+    """Schema validation needs fastjsonschema; accept the state as-is"""
+    return state
+
+# Compiled validators keyed by the canonical JSON dump of their schema, so
+# every manager (and any per-section schema) compiles at most once
+_VALIDATOR_CACHE = {}
+_VALIDATOR_LOCK = threading.Lock()
+
+def get_validator(schema):
+    """Return a compiled validator for schema, compiling it on first use"""
+    if fastjsonschema is None:
+        return _accept
+    
+    if orjson is not None:
+        key = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    else:
+        key = json.dumps(schema, sort_keys=True)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        with _VALIDATOR_LOCK:
+            validator = _VALIDATOR_CACHE.get(key)
+            if validator is None:
+                validator = fastjsonschema.compile(schema, formats={"date-time": _is_iso_datetime})
+                _VALIDATOR_CACHE[key] = validator
+    return validator
+
+if fastjsonschema is not None:
+    ValidationError = fastjsonschema.JsonSchemaValueException
+else:
+    ValidationError = ValueError
+
+# Compile the main schema once at import time
+validate_state = get_validator(MEMORY_BANK_SCHEMA)
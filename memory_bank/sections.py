@@ -1,106 +1,167 @@
 # memory_bank/sections.py
-import datetime
+from .core import _now_iso
+
+# Sentinel for "no such section", since a section's value may itself be None
+_MISSING = object()
+
+def _status(state, name, default=None):
+    """Get the status of a section, or default if it's missing, not a dictionary or has no status"""
+    section = state.get(name)
+    return section.get("status", default) if isinstance(section, dict) else default
+
+def _statuses(state):
+    """Map each section that is a dictionary with a status field to that status"""
+    return {
+        name: section["status"]
+        for name, section in state.items()
+        if isinstance(section, dict) and "status" in section
+    }
 
 def get_section(memory_manager, section_name):
     """Get content of a specific memory section"""
-    if section_name in memory_manager.memory_state:
-        return memory_manager.memory_state[section_name]
-    return None
+    return memory_manager.memory_state.get(section_name)
+
+def _set(target, key, value):
+    """Set target[key] to value, returning whether that changed anything"""
+    if key in target and target[key] == value:
+        return False
+    target[key] = value
+    return True
+
+def _update_project_info(section, content, metadata):
+    """Handle projectInfo special case (maps to projectbrief.md)"""
+    changed = _set(section, "content", content)
+    if metadata:
+        for key, value in metadata.items():
+            changed = _set(section, key, value) or changed
+    return changed
+
+def _update_technologies(section, content, metadata):
+    """Handle technologies special case (maps to techContext.md)"""
+    return _set(section, "content", content)
+
+def _update_tasks(section, content, metadata):
+    """Handle tasks special case (active context)"""
+    changed = False
+    if metadata and "activeContext" in metadata:
+        changed = _set(section["current"], "activeContext", metadata["activeContext"])
+        
+    if metadata and "progress" in metadata:
+        # Log progress as a completed task
+        task = {
+            "timestamp": _now_iso(),
+            "description": metadata.get("description", "Task completed"),
+            "progress": metadata["progress"],
+            "status": "Completed"
+        }
+        history = section.setdefault("history", [])
+        if not isinstance(history, list):
+            history = section["history"] = []
+        history.append(task)
+        changed = True
+    return changed
+
+def _update_default(section, content, metadata):
+    """Handle generic section - only if it's a dictionary"""
+    return isinstance(section, dict) and _set(section, "content", content)
+
+# Section name -> update handler, for the sections that need special handling.
+# Handlers return whether they changed the section.
+_UPDATE_HANDLERS = {
+    "projectInfo": _update_project_info,
+    "technologies": _update_technologies,
+    "tasks": _update_tasks
+}
 
 def update_section(memory_manager, section_name, content, metadata=None):
     """Update content of a memory section"""
-    if section_name in memory_manager.memory_state:
-        if section_name == "projectInfo":
-            # Handle projectInfo special case (maps to projectbrief.md)
-            memory_manager.memory_state[section_name]["content"] = content
-            if metadata:
-                for key, value in metadata.items():
-                    memory_manager.memory_state[section_name][key] = value
-        elif section_name == "technologies":
-            # Handle technologies special case (maps to techContext.md)
-            memory_manager.memory_state[section_name]["content"] = content
-        elif section_name == "tasks":
-            # Handle tasks special case (active context)
-            if metadata and "activeContext" in metadata:
-                memory_manager.memory_state[section_name]["current"]["activeContext"] = metadata["activeContext"]
-                
-            if metadata and "progress" in metadata:
-                # Log progress as a completed task
-                task = {
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "description": metadata.get("description", "Task completed"),
-                    "progress": metadata["progress"],
-                    "status": "Completed"
-                }
-                memory_manager.memory_state[section_name]["history"].append(task)
-        else:
-            # Handle generic section - only if it's a dictionary
-            if isinstance(memory_manager.memory_state[section_name], dict):
-                memory_manager.memory_state[section_name]["content"] = content
+    # One lookup both checks the section exists and fetches it
+    section = memory_manager.memory_state.get(section_name, _MISSING)
+    if section is not _MISSING:
+        changed = _UPDATE_HANDLERS.get(section_name, _update_default)(section, content, metadata)
             
         # Update status to complete - only if it's a dictionary with a status field
-        if isinstance(memory_manager.memory_state[section_name], dict) and "status" in memory_manager.memory_state[section_name]:
-            memory_manager.memory_state[section_name]["status"] = "Complete"
+        if isinstance(section, dict) and "status" in section:
+            changed = _set(section, "status", "Complete") or changed
         
-        memory_manager.save_memory_state()
+        # Journal just this section rather than rewriting the whole state file,
+        # and skip even that when the update didn't change anything
+        if changed:
+            memory_manager.append_delta({section_name: section})
         return True
     return False
 
+def update_sections(memory_manager, contents, metadata=None):
+    """Update several sections at once, writing them in a single save
+
+    contents maps section names to their new content and metadata maps
+    section names to their metadata. Returns the names that didn't exist.
+    """
+    metadata = metadata or {}
+    with memory_manager.batch():
+        return [
+            section_name
+            for section_name, content in contents.items()
+            if not update_section(memory_manager, section_name, content, metadata.get(section_name))
+        ]
+
+def mark_complete(memory_manager, section_name):
+    """Mark a section complete without touching its content"""
+    section = memory_manager.memory_state.get(section_name)
+    # Only dictionaries with a status field have a status to flip
+    if not isinstance(section, dict) or "status" not in section:
+        return False
+    if _set(section, "status", "Complete"):
+        memory_manager.append_delta({section_name: section})
+    return True
+
 def check_dependencies_complete(memory_manager, section_name):
     """Check if dependencies for a section are complete"""
-    if section_name in memory_manager.section_dependencies:
-        dependencies = memory_manager.section_dependencies[section_name]
-        for dep in dependencies:
-            # Check if dependency exists in memory state
-            if dep not in memory_manager.memory_state:
-                return False
-                
-            # Skip dependencies that aren't dictionaries or don't have a status field
-            if not isinstance(memory_manager.memory_state[dep], dict):
-                continue
-                
-            if "status" not in memory_manager.memory_state[dep]:
-                continue
-                
-            if memory_manager.memory_state[dep]["status"] != "Complete":
-                return False
-        return True
-    return False
+    dependencies = memory_manager.section_dependencies.get(section_name)
+    if dependencies is None:
+        return False
+    
+    state = memory_manager.memory_state
+    # Every dependency must exist (one subset test on the frozenset) and be
+    # complete; ones that aren't dictionaries or don't have a status field
+    # count as complete
+    return dependencies <= state.keys() and all(_status(state, dep, "Complete") == "Complete" for dep in dependencies)
 
-def get_ready_sections(memory_manager):
-    """Get sections that are ready to be completed based on dependencies"""
-    ready_sections = []
-    for section_name in memory_manager.section_dependencies:
-        # Check if section exists in memory state
-        if section_name not in memory_manager.memory_state:
-            continue
-            
-        # Skip sections that aren't dictionaries
-        if not isinstance(memory_manager.memory_state[section_name], dict):
-            continue
-            
-        # Skip sections without a status field
-        if "status" not in memory_manager.memory_state[section_name]:
-            continue
-            
-        if memory_manager.memory_state[section_name]["status"] != "Complete":
-            if check_dependencies_complete(memory_manager, section_name):
-                ready_sections.append(section_name)
-    return ready_sections
+def get_ready_sections(memory_manager, statuses=None):
+    """Get sections that are ready to be completed based on dependencies
+
+    statuses is the _statuses() of the current state, for callers that
+    already computed it.
+    """
+    state = memory_manager.memory_state
+    if statuses is None:
+        statuses = _statuses(state)
+    # Sections that have a status and aren't complete. Sections without a
+    # status never block their dependents.
+    incomplete = {name for name, status in statuses.items() if status != "Complete"}
+    
+    present = state.keys()
+    # Dependencies are frozensets, so each check is a pair of C-level set tests
+    return [
+        section_name
+        for section_name, dependencies in memory_manager.section_dependencies.items()
+        if section_name in incomplete and dependencies.isdisjoint(incomplete) and dependencies <= present
+    ]
 
 def log_change(memory_manager, description, details=None):
     """Log a change to the change history"""
     change = {
-        "timestamp": datetime.datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "description": description,
         "details": details or {}
     }
     
-    # Ensure changeHistory exists and is a list
-    if "changeHistory" not in memory_manager.memory_state:
-        memory_manager.memory_state["changeHistory"] = []
-    elif not isinstance(memory_manager.memory_state["changeHistory"], list):
-        memory_manager.memory_state["changeHistory"] = []
-    
-    memory_manager.memory_state["changeHistory"].append(change)
-    memory_manager.save_memory_state()
+    # Appends to changeHistory and its on-disk log rather than rewriting the
+    # whole state file
+    memory_manager.append_change_log(change)
+
+def update_active_context(memory_manager, active_context, description, details=None):
+    """Set the current task's active context and log the change, saving once"""
+    with memory_manager.batch():
+        update_section(memory_manager, "tasks", "", {"activeContext": active_context})
+        log_change(memory_manager, description, details)
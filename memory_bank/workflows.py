@@ -1,33 +1,39 @@
 # memory_bank/workflows.py
-from .sections import get_ready_sections
+from .sections import _status, _statuses, get_ready_sections
+
+# Sections that must be complete before each mode
+_PLAN_REQUIRED = ("projectInfo", "productContext", "systemPatterns", "technologies")
+_ACT_REQUIRED = ("projectInfo", "productContext", "technologies")
+
+# Sections whose status update_all_memory_bank reports
+_REVIEW_STATUS = (
+    "projectInfo",   # projectbrief.md
+    "productContext", # productContext.md
+    "systemPatterns", # systemPatterns.md
+    "technologies",   # techContext.md
+    "standards"       # additional standards
+)
+
+# Everything update_all_memory_bank asks to review, in order
+_REVIEW_SECTIONS = (
+    "projectInfo",   # projectbrief.md
+    "productContext", # productContext.md
+    "systemPatterns", # systemPatterns.md
+    "technologies",   # techContext.md
+    "tasks",          # activeContext.md and progress.md
+    "standards"       # additional standards
+)
 
 def enter_plan_mode(memory_manager):
     """Prepare for planning mode workflow"""
-    # Check incomplete sections
-    incomplete_sections = []
-    required_sections = ["projectInfo", "productContext", "systemPatterns", "technologies"]
+    # One pass over the state serves both the incomplete and the ready checks
+    statuses = _statuses(memory_manager.memory_state)
     
-    for name in required_sections:
-        # Skip if section doesn't exist
-        if name not in memory_manager.memory_state:
-            incomplete_sections.append(name)
-            continue
-            
-        # Skip sections that aren't dictionaries
-        if not isinstance(memory_manager.memory_state[name], dict):
-            incomplete_sections.append(name)
-            continue
-            
-        # Skip sections without a status field
-        if "status" not in memory_manager.memory_state[name]:
-            incomplete_sections.append(name)
-            continue
-            
-        if memory_manager.memory_state[name]["status"] != "Complete":
-            incomplete_sections.append(name)
+    # Check incomplete sections
+    incomplete_sections = [name for name in _PLAN_REQUIRED if statuses.get(name) != "Complete"]
     
     # Get sections that are ready to work on based on dependencies
-    ready_sections = get_ready_sections(memory_manager)
+    ready_sections = get_ready_sections(memory_manager, statuses)
     
     return {
         "mode": "Plan",
@@ -39,41 +45,22 @@ def enter_plan_mode(memory_manager):
 def enter_act_mode(memory_manager):
     """Prepare for action mode workflow"""
     # First check that all required sections exist
-    all_sections_ready = True
-    required_sections = ["projectInfo", "productContext", "technologies"]
+    state = memory_manager.memory_state
+    all_sections_ready = all(_status(state, name) == "Complete" for name in _ACT_REQUIRED)
+    
+    tasks = state.get("tasks")
+    if not isinstance(tasks, dict):
+        tasks = {}
     
-    for name in required_sections:
-        # Check if section exists
-        if name not in memory_manager.memory_state:
-            all_sections_ready = False
-            continue
-            
-        # Check if section is a dictionary
-        if not isinstance(memory_manager.memory_state[name], dict):
-            all_sections_ready = False
-            continue
-            
-        # Check if section has a status field
-        if "status" not in memory_manager.memory_state[name]:
-            all_sections_ready = False
-            continue
-            
-        if memory_manager.memory_state[name]["status"] != "Complete":
-            all_sections_ready = False
-            
     # Get active context
-    active_context = ""
-    if "tasks" in memory_manager.memory_state and isinstance(memory_manager.memory_state["tasks"], dict):
-        if "current" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["current"], dict):
-            active_context = memory_manager.memory_state["tasks"]["current"].get("activeContext", "")
+    current = tasks.get("current")
+    active_context = current.get("activeContext", "") if isinstance(current, dict) else ""
     
     # Get progress from history
-    progress_items = []
-    if "tasks" in memory_manager.memory_state and isinstance(memory_manager.memory_state["tasks"], dict):
-        if "history" in memory_manager.memory_state["tasks"] and isinstance(memory_manager.memory_state["tasks"]["history"], list):
-            for task in memory_manager.memory_state["tasks"]["history"]:
-                if isinstance(task, dict) and "progress" in task:
-                    progress_items.append(task["progress"])
+    history = tasks.get("history")
+    if not isinstance(history, list):
+        history = []
+    progress_items = [task["progress"] for task in history if isinstance(task, dict) and "progress" in task]
     
     return {
         "mode": "Act",
@@ -86,38 +73,21 @@ def update_all_memory_bank(memory_manager):
     """Review and update all memory bank files"""
     # Get current state of each section safely
     current_state = {}
-    sections_to_check = [
-        "projectInfo",   # projectbrief.md
-        "productContext", # productContext.md
-        "systemPatterns", # systemPatterns.md
-        "technologies",   # techContext.md
-        "standards"       # additional standards
-    ]
-    
-    for name in sections_to_check:
-        if name in memory_manager.memory_state and isinstance(memory_manager.memory_state[name], dict) and "status" in memory_manager.memory_state[name]:
-            current_state[name] = memory_manager.memory_state[name]["status"]
-        else:
-            current_state[name] = "Unknown"
+    state = memory_manager.memory_state
+    for name in _REVIEW_STATUS:
+        section = state.get(name)
+        current_state[name] = section.get("status", "Unknown") if isinstance(section, dict) else "Unknown"
     
     # Check tasks section safely
-    if "tasks" in memory_manager.memory_state and isinstance(memory_manager.memory_state["tasks"], dict):
-        if "current" in memory_manager.memory_state["tasks"] and memory_manager.memory_state["tasks"]["current"]:
-            current_state["tasks"] = "Active"
-        else:
-            current_state["tasks"] = "None"
+    tasks = state.get("tasks")
+    if isinstance(tasks, dict):
+        current_state["tasks"] = "Active" if tasks.get("current") else "None"
     else:
         current_state["tasks"] = "Unknown"
     
     return {
         "action": "review_all",
-        "sections": [
-            "projectInfo",   # projectbrief.md
-            "productContext", # productContext.md
-            "systemPatterns", # systemPatterns.md
-            "technologies",   # techContext.md
-            "tasks",          # activeContext.md and progress.md
-            "standards"       # additional standards
-        ],
+        # Still handed out as a list, as callers may extend it
+        "sections": list(_REVIEW_SECTIONS),
         "current_state": current_state
     }
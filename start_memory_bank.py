@@ -12,8 +12,10 @@ plan_status = enter_plan_mode(memory)
 if "projectInfo" in plan_status["ready_sections"]:
     print("Project needs a brief! Let's create one.")
     
-    # Update project brief
-    update_section(memory, "projectInfo", '''
+    # Write the brief and its change entry in one save
+    with memory.batch():
+        # Update project brief
+        update_section(memory, "projectInfo", '''
 # Project Brief: New Project
 
 ## Objective
@@ -24,9 +26,9 @@ This project aims to...
 - Requirement 2
 - Requirement 3
 ''', {"name": "New Project", "description": "A brief description"})
-    
-    # Log the change
-    log_change(memory, "Created initial project brief")
+        
+        # Log the change
+        log_change(memory, "Created initial project brief")
     
     print("Created project brief")
 else:
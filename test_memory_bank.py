@@ -5,8 +5,56 @@ Test script to verify the ability to retrieve and modify memory bank state.
 
 import os
 import sys
+import json
+import tempfile
+from pathlib import Path
 from memory_bank.core import MemoryBankManager
-from memory_bank.sections import get_section, update_section, log_change
+from memory_bank.sections import get_section, update_section, update_sections, mark_complete, log_change
+
+def _outcome(apply):
+    """Apply an update to a fresh memory bank; the state, reloaded state and files it leaves"""
+    def without_metadata(state):
+        # Timestamps differ from run to run
+        return {name: section for name, section in state.items() if name != "metadata"}
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # The same directory name every time, since it becomes the project name
+        project = Path(tmp) / "project"
+        project.mkdir()
+        memory = MemoryBankManager(project)
+        memory.save_memory_state()
+        apply(memory)
+        
+        files = {}
+        for name in ("memory_state.json", "memory_state.log", "change_history.jsonl"):
+            path = memory.memory_path / name
+            if path.exists():
+                entries = [json.loads(line) for line in path.read_text().splitlines()] if name.endswith(("log", "jsonl")) \
+                    else [json.loads(path.read_text())]
+                files[name] = [without_metadata(entry) for entry in entries]
+        return (
+            without_metadata(memory.memory_state),
+            without_metadata(MemoryBankManager(project).memory_state),
+            files,
+        )
+
+def check_helpers_match_update_section():
+    """Check mark_complete and update_sections leave what update_section calls would"""
+    def complete_by_update(memory):
+        update_section(memory, "productContext", memory.memory_state["productContext"]["content"])
+    
+    contents = {"productContext": "# Product", "technologies": "# Technologies", "tasks": ""}
+    metadata = {"tasks": {"activeContext": "Testing"}}
+    
+    def sections_by_update(memory):
+        with memory.batch():
+            for name, content in contents.items():
+                update_section(memory, name, content, metadata.get(name))
+    
+    return {
+        "mark_complete": _outcome(lambda memory: mark_complete(memory, "productContext")) == _outcome(complete_by_update),
+        "update_sections": _outcome(lambda memory: update_sections(memory, contents, metadata)) == _outcome(sections_by_update),
+    }
 
 def main():
     """Main test function"""
@@ -26,43 +74,50 @@ def main():
     # Test modifying sections
     print("\n--- Modifying Sections ---")
     
-    # Update projectInfo
-    projectInfo = get_section(memory, "projectInfo")
-    print(f"Original project name: {projectInfo.get('name', 'Not set')}")
-    
-    update_section(memory, "projectInfo", 
-                 "# Task Master State Management\n\nReplacing direct file operations with centralized state management.", 
-                 {"name": "Task Master State", "description": "State management refactoring"})
-    
-    projectInfo = get_section(memory, "projectInfo")
-    print(f"Updated project name: {projectInfo.get('name', 'Not set')}")
-    
-    # Update productContext
-    print("\nUpdating productContext section...")
-    update_section(memory, "productContext", 
-                 "# Product Context\n\nTask Master needs to centralize state management instead of reading/writing to files directly.")
-    
-    # Update systemPatterns
-    print("Updating systemPatterns section...")
-    update_section(memory, "systemPatterns", 
-                 "# System Patterns\n\nWill implement a state store pattern with centralized access/mutation via actions.")
-    
-    # Update technologies
-    print("Updating technologies section...")
-    update_section(memory, "technologies", 
-                 "# Technologies\n\n- Node.js\n- JavaScript (ES Modules)")
-    
-    # Update tasks
-    print("Updating tasks current context...")
-    update_section(memory, "tasks", "", {"activeContext": "Evaluating the current code structure"})
-    
-    # Update standards
-    print("Updating standards section...")
-    update_section(memory, "standards", 
-                 "# Standards\n\n- State transitions should be controlled\n- Backward compatibility is essential")
+    # Write all the modifications in one save
+    with memory.batch():
+        # Update projectInfo
+        projectInfo = get_section(memory, "projectInfo")
+        print(f"Original project name: {projectInfo.get('name', 'Not set')}")
+        
+        update_section(memory, "projectInfo", 
+                     "# Task Master State Management\n\nReplacing direct file operations with centralized state management.", 
+                     {"name": "Task Master State", "description": "State management refactoring"})
+        
+        projectInfo = get_section(memory, "projectInfo")
+        print(f"Updated project name: {projectInfo.get('name', 'Not set')}")
+        
+        # Update productContext
+        print("\nUpdating productContext section...")
+        update_section(memory, "productContext", 
+                     "# Product Context\n\nTask Master needs to centralize state management instead of reading/writing to files directly.")
+        
+        # Update systemPatterns
+        print("Updating systemPatterns section...")
+        update_section(memory, "systemPatterns", 
+                     "# System Patterns\n\nWill implement a state store pattern with centralized access/mutation via actions.")
+        
+        # Update technologies
+        print("Updating technologies section...")
+        update_section(memory, "technologies", 
+                     "# Technologies\n\n- Node.js\n- JavaScript (ES Modules)")
+        
+        # Update tasks
+        print("Updating tasks current context...")
+        update_section(memory, "tasks", "", {"activeContext": "Evaluating the current code structure"})
+        
+        # Update standards
+        print("Updating standards section...")
+        update_section(memory, "standards", 
+                     "# Standards\n\n- State transitions should be controlled\n- Backward compatibility is essential")
+        
+        # Log a change
+        log_change(memory, "Tested memory bank modifications", {"test": "successful"})
     
-    # Log a change
-    log_change(memory, "Tested memory bank modifications", {"test": "successful"})
+    # Test that the multi-section helpers match plain section updates
+    print("\n--- Comparing Helpers ---")
+    for helper, ok in check_helpers_match_update_section().items():
+        print(f"{helper}: {'Matches update_section' if ok else 'Differs from update_section'}")
     
     print("\nTest completed. Memory bank sections have been modified.")
     print("Check memory-bank/memory_state.json to verify changes.")
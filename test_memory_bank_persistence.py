@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that memory bank state survives being saved and loaded again.
+"""
+
+import io
+import json
+import os
+import contextlib
+import subprocess
+import sys
+import tempfile
+import importlib.util
+from pathlib import Path
+from memory_bank.core import MemoryBankManager
+from memory_bank.sections import update_section, update_sections, log_change
+from memory_bank.schemas import fastjsonschema
+from memory_bank.exporters import export_markdown
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+def _history(memory):
+    """Descriptions of the change history as the manager sees it"""
+    return [change["description"] for change in memory.memory_state["changeHistory"]]
+
+def _files(path):
+    """Every file under path with its size and mtime"""
+    return {
+        str(p.relative_to(path)): (p.stat().st_size, p.stat().st_mtime_ns)
+        for p in sorted(Path(path).rglob("*")) if p.is_file()
+    }
+
+def check_reload_after_batch(project):
+    """A batch's section updates and change entries are all there after a reload"""
+    memory = MemoryBankManager(project)
+    with memory.batch():
+        update_sections(memory, {"productContext": "# Product", "systemPatterns": "# Patterns"})
+        log_change(memory, "first")
+        log_change(memory, "second")
+    
+    reloaded = MemoryBankManager(project)
+    return (
+        (memory.memory_path / "memory_state.json").exists()
+        and reloaded.memory_state["productContext"]["content"] == "# Product"
+        and reloaded.memory_state["systemPatterns"]["status"] == "Complete"
+        and _history(reloaded) == ["first", "second"]
+    )
+
+def check_reload_after_rebootstrap(project):
+    """Bootstrapping over an existing memory bank starts it over completely"""
+    spec = importlib.util.spec_from_file_location("bootstrap_memory_bank", REPO_ROOT / "bootstrap-memory-bank.py")
+    bootstrap = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bootstrap)
+    
+    memory = bootstrap.bootstrap_memory_bank(Path(project), verbose=False)
+    update_section(memory, "projectInfo", "# Old brief")
+    update_section(memory, "productContext", "# Old product")
+    log_change(memory, "old change")
+    
+    memory = bootstrap.bootstrap_memory_bank(Path(project), verbose=False)
+    reloaded = type(memory)(project)
+    return (
+        reloaded.memory_state["projectInfo"]["status"] == "Not Started"
+        and reloaded.memory_state["productContext"]["content"] == ""
+        and _history(reloaded) == []
+        and reloaded.memory_state["projectInfo"] == memory.memory_state["projectInfo"]
+    )
+
+def check_torn_journal_line(project):
+    """An append interrupted mid-line doesn't take the next entry down with it"""
+    memory = MemoryBankManager(project)
+    log_change(memory, "one")
+    update_section(memory, "productContext", "# Product")
+    update_section(memory, "systemPatterns", "# Patterns")
+    # Simulate a crash partway through an append to each journal
+    with open(memory.change_log_file, "ab") as f:
+        f.write(b'{"timestamp": "2025-01-01T00:00:00", "descr')
+    with open(memory.delta_log_file, "ab") as f:
+        f.write(b'{"standards": {"cont')
+    
+    memory = MemoryBankManager(project)
+    log_change(memory, "two")
+    update_section(memory, "technologies", "# Technologies")
+    
+    reloaded = MemoryBankManager(project)
+    return (
+        _history(reloaded) == ["one", "two"]
+        and reloaded.memory_state["systemPatterns"]["content"] == "# Patterns"
+        and reloaded.memory_state["technologies"]["content"] == "# Technologies"
+    )
+
+def check_legacy_history_migration(project):
+    """History stored in an old-style state file moves into the archive once"""
+    memory = MemoryBankManager(project)
+    memory.save_memory_state()
+    state_file = memory.memory_path / "memory_state.json"
+    state = json.loads(state_file.read_text())
+    state["changeHistory"] = [
+        {"timestamp": "2025-01-01T00:00:00", "description": "legacy one", "details": {}},
+        {"timestamp": "2025-01-02T00:00:00", "description": "legacy two", "details": {}},
+    ]
+    state_file.write_text(json.dumps(state, indent=2))
+    
+    memory = MemoryBankManager(project)
+    log_change(memory, "new")
+    MemoryBankManager(project)
+    
+    reloaded = MemoryBankManager(project)
+    archived = [change["description"] for change in reloaded.iter_change_history()]
+    return (
+        _history(reloaded) == ["legacy one", "legacy two", "new"]
+        and archived == ["legacy one", "legacy two", "new"]
+    )
+
+def check_dry_run_writes_nothing(project):
+    """update_project_brief.py --dry-run leaves the memory bank untouched"""
+    # An existing bank with legacy history, which loading would normally migrate
+    memory = MemoryBankManager(project)
+    memory.memory_state["changeHistory"].append(
+        {"timestamp": "2025-01-01T00:00:00", "description": "legacy", "details": {}})
+    state_file = memory.memory_path / "memory_state.json"
+    state_file.write_text(json.dumps(memory.memory_state, indent=2))
+    before = _files(project)
+    
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(REPO_ROOT), os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run([sys.executable, str(REPO_ROOT / "update_project_brief.py"), "--dry-run", "-q"],
+                            cwd=project, env=env, capture_output=True, text=True)
+    
+    # And a dry run in a directory without a memory bank creates nothing
+    with tempfile.TemporaryDirectory() as empty:
+        empty_result = subprocess.run([sys.executable, str(REPO_ROOT / "update_project_brief.py"), "--dry-run", "-q"],
+                                      cwd=empty, env=env, capture_output=True, text=True)
+        empty_untouched = os.listdir(empty) == []
+    
+    return (
+        result.returncode == 0 and empty_result.returncode == 0
+        and _files(project) == before
+        and empty_untouched
+    )
+
+def check_non_str_keys(project):
+    """Change details with non-string keys are saved the way json.dumps saves them"""
+    memory = MemoryBankManager(project)
+    log_change(memory, "numbered", {1: "one", 2: "two"})
+    memory.save_memory_state()
+    
+    # An entry that can't be serialized at all is rejected without being
+    # left in the history, so later saves still go through
+    try:
+        log_change(memory, "unserializable", {"value": object()})
+    except TypeError:
+        pass
+    update_section(memory, "productContext", "# Product")
+    memory.save_memory_state()
+    
+    reloaded = MemoryBankManager(project)
+    return (
+        _history(memory) == ["numbered"]
+        and reloaded.memory_state["changeHistory"][0]["details"] == {"1": "one", "2": "two"}
+        and reloaded.memory_state["productContext"]["content"] == "# Product"
+    )
+
+def check_rollback_on_error(project):
+    """A batch that raises leaves the state, the snapshot and the journals as they were"""
+    memory = MemoryBankManager(project)
+    memory.save_memory_state()
+    update_section(memory, "productContext", "# Product")
+    log_change(memory, "before")
+    before_state = json.loads(json.dumps(memory.memory_state))
+    journals = ("memory_state.json", "memory_state.log", "change_history.jsonl")
+    before_files = {name: (memory.memory_path / name).read_bytes() for name in journals}
+    
+    try:
+        with memory.batch():
+            update_section(memory, "productContext", "# Half-applied")
+            update_section(memory, "systemPatterns", "# Half-applied")
+            log_change(memory, "during")
+            raise RuntimeError("interrupted")
+    except RuntimeError:
+        pass
+    
+    reloaded = MemoryBankManager(project)
+    return (
+        memory.memory_state == before_state
+        and reloaded.memory_state == before_state
+        and {name: (memory.memory_path / name).read_bytes() for name in journals} == before_files
+    )
+
+def _load_quarantined(project, contents):
+    """Load a memory bank whose state file holds contents, and what became of the file"""
+    memory_path = Path(project) / "memory-bank"
+    memory_path.mkdir()
+    (memory_path / "memory_state.json").write_bytes(contents)
+    with contextlib.redirect_stderr(io.StringIO()):
+        memory = MemoryBankManager(project)
+    corrupt_files = list(memory_path.glob("memory_state.corrupt-*.json"))
+    return (
+        memory.memory_state["projectInfo"]["status"] == "Not Started"
+        and len(corrupt_files) == 1
+        and corrupt_files[0].read_bytes() == contents
+        and not (memory_path / "memory_state.json").exists()
+    )
+
+def check_corrupt_state_quarantined(project):
+    """A state file that isn't valid JSON is set aside and the defaults are used"""
+    return _load_quarantined(project, b'{"projectInfo": {"cont')
+
+def check_non_object_state_quarantined(project):
+    """A state file holding valid JSON that isn't an object is set aside too"""
+    return _load_quarantined(project, b"[]")
+
+def check_invalid_state_refused(project):
+    """A state file that fails the schema is refused and left where it is"""
+    memory = MemoryBankManager(project)
+    memory.save_memory_state()
+    state_file = memory.memory_path / "memory_state.json"
+    state = json.loads(state_file.read_text())
+    del state["tasks"]
+    state_file.write_text(json.dumps(state, indent=2))
+    contents = state_file.read_bytes()
+    
+    try:
+        MemoryBankManager(project)
+    except ValueError:
+        refused = True
+    else:
+        refused = False
+    return (
+        refused
+        and state_file.read_bytes() == contents
+        and not list(memory.memory_path.glob("memory_state.corrupt-*.json"))
+    )
+
+def check_saved_snapshot_matches_state(project):
+    """The state file holds exactly the saved state, with the new lastUpdated"""
+    memory = MemoryBankManager(project)
+    memory.save_memory_state()
+    before = memory.memory_state["metadata"]["lastUpdated"]
+    # Section content that looks like the metadata key mustn't be touched
+    memory.memory_state["productContext"]["content"] = f'Note\n    "lastUpdated": "{before}"'
+    memory.memory_state["productContext"]["lastUpdated"] = before
+    memory.save_memory_state()
+    
+    saved = json.loads((memory.memory_path / "memory_state.json").read_text())
+    return (
+        saved == {**memory.memory_state, "changeHistory": []}
+        and saved["metadata"]["lastUpdated"] != before
+        and saved["productContext"]["lastUpdated"] == before
+    )
+
+def check_export_rewrites_only_changes(project):
+    """Exporting again only rewrites the markdown files whose content changed"""
+    def stamps(memory):
+        # The inode too, since a rewrite can land within the same mtime tick
+        return {p.name: (p.stat().st_ino, p.stat().st_mtime_ns) for p in memory.memory_path.glob("*.md")}
+    
+    memory = MemoryBankManager(project)
+    update_sections(memory, {"productContext": "# Product", "systemPatterns": "# Patterns"})
+    export_markdown(memory)
+    first = stamps(memory)
+    export_markdown(memory)
+    unchanged = stamps(memory) == first
+    
+    update_section(memory, "productContext", "# Product, revised")
+    export_markdown(memory)
+    rewritten = {name for name, stamp in stamps(memory).items() if stamp != first[name]}
+    return (
+        len(first) > 1
+        and unchanged
+        and rewritten == {"productContext.md"}
+        and (memory.memory_path / "productContext.md").read_text().startswith("# Product, revised")
+    )
+
+def main():
+    """Main test function"""
+    print("Testing Memory Bank State persistence...")
+    
+    checks = [
+        check_reload_after_batch,
+        check_reload_after_rebootstrap,
+        check_torn_journal_line,
+        check_legacy_history_migration,
+        check_dry_run_writes_nothing,
+        check_non_str_keys,
+        check_rollback_on_error,
+        check_corrupt_state_quarantined,
+        check_non_object_state_quarantined,
+        check_saved_snapshot_matches_state,
+        check_export_rewrites_only_changes,
+    ]
+    if fastjsonschema is not None:
+        # Without fastjsonschema the state isn't validated at all
+        checks.append(check_invalid_state_refused)
+    
+    failed = 0
+    for check in checks:
+        # Every check gets a memory bank of its own
+        with tempfile.TemporaryDirectory() as project:
+            try:
+                ok = check(project)
+            except Exception as e:
+                print(f"  ({type(e).__name__}: {e})")
+                ok = False
+        print(f"{check.__doc__}: {'OK' if ok else 'FAILED'}")
+        failed += not ok
+    
+    print(f"\nTest completed. {len(checks) - failed} of {len(checks)} checks passed.")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
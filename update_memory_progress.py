@@ -3,15 +3,14 @@
 Update the memory bank with current implementation progress.
 """
 from memory_bank.core import MemoryBankManager
-from memory_bank.sections import update_section, log_change
+from memory_bank.sections import update_active_context
 
 def main():
     """Update the memory bank with implementation progress"""
     memory = MemoryBankManager()
     
-    # Update tasks with current progress
-    update_section(memory, "tasks", "", {
-        "activeContext": """
+    # Update tasks with current progress and log the change
+    update_active_context(memory, """
 Implementing the Task Master state management refactoring as outlined in the PRD.
 
 Progress so far:
@@ -26,11 +25,7 @@ Next steps:
 3. Update ui.js to get task data from the state store
 4. Refactor dependency-manager.js to use the centralized state
 5. Create tests for the new architecture
-"""
-    })
-    
-    # Log the change
-    log_change(memory, "Implemented core state management infrastructure", {
+""", "Implemented core state management infrastructure", {
         "phase": "Implementation",
         "components_created": [
             "state-store.js",
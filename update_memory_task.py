@@ -3,15 +3,14 @@
 Update the memory bank with current task information.
 """
 from memory_bank.core import MemoryBankManager
-from memory_bank.sections import update_section, log_change
+from memory_bank.sections import update_active_context
 
 def main():
     """Update the memory bank with current task"""
     memory = MemoryBankManager()
     
-    # Update tasks with current focus
-    update_section(memory, "tasks", "", {
-        "activeContext": """
+    # Update tasks with current focus and log the change
+    update_active_context(memory, """
 Currently analyzing the original Task Master codebase to identify all places where direct file operations 
 on tasks.json occur. This will help create a comprehensive map of state operations that need to be 
 refactored to use the centralized state store.
@@ -23,11 +22,7 @@ The analysis is focusing on:
 - scripts/modules/dependency-manager.js (Task dependency management)
 
 Next steps will be to implement the state-store.js module based on the findings.
-"""
-    })
-    
-    # Log the change
-    log_change(memory, "Started Task Master state management analysis", {
+""", "Started Task Master state management analysis", {
         "phase": "Analysis",
         "target_files": [
             "task-manager.js",